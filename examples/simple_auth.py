@@ -11,12 +11,17 @@ Usage:
 """
 
 import argparse
+import asyncio
 import os
 import sys
+import threading
+import time
+from collections.abc import Iterator
 
 try:
-    from ldap3 import ALL, Connection, Server
+    from ldap3 import ALL, NONE, SIMPLE, Connection, Server
     from ldap3.core.exceptions import LDAPBindError, LDAPException
+    from ldap3.utils.conv import escape_filter_chars
 except ImportError:
     print("Error: ldap3 library not found.")
     print("Install it with: uv pip install ldap3")
@@ -30,15 +35,143 @@ LDAP_BASE_DN = os.environ.get("LDAP_BASE_DN", "dc=testing,dc=local")
 LDAP_PEOPLE_OU = f"ou=people,{LDAP_BASE_DN}"
 LDAP_GROUPS_OU = f"ou=groups,{LDAP_BASE_DN}"
 
+# How long cached user-info / group lookups stay valid (seconds)
+LOOKUP_CACHE_TTL = 60.0
+
+# Pre-built search filter templates. Usernames are passed through
+# escape_filter_chars before interpolation, so special characters cannot
+# change the filter's shape (LDAP filter injection).
+_UID_FILTER = "(uid={})"
+_MEMBER_FILTER = "(member=uid={}," + LDAP_PEOPLE_OU + ")"
+
+
+def _first_value(value) -> str:
+    """Return the first value of a (possibly multi-valued) LDAP attribute."""
+    if isinstance(value, list):
+        return str(value[0]) if value else ""
+    return str(value) if value is not None else ""
+
+
+def _user_info_from_attrs(attrs: dict, dn: str) -> dict:
+    """Build a user-info dict from a raw LDAP attribute dict."""
+    uid_number = _first_value(attrs.get("uidNumber"))
+    gid_number = _first_value(attrs.get("gidNumber"))
+    return {
+        "username": _first_value(attrs.get("uid")),
+        "full_name": _first_value(attrs.get("cn")),
+        "first_name": _first_value(attrs.get("givenName")),
+        "last_name": _first_value(attrs.get("sn")),
+        "email": _first_value(attrs.get("mail")),
+        "uid_number": int(uid_number) if uid_number else None,
+        "gid_number": int(gid_number) if gid_number else None,
+        "dn": dn,
+    }
+
 
 class LDAPAuthenticator:
     """Simple LDAP authentication helper."""
 
-    def __init__(self, server_url: str = LDAP_SERVER, base_dn: str = LDAP_BASE_DN):
-        """Initialize the authenticator."""
+    # Server objects cached per (url, schema) so repeated authenticators in
+    # one process share DSE/schema state instead of re-fetching it per bind.
+    _SERVERS: dict = {}
+
+    def __init__(
+        self,
+        server_url: str = LDAP_SERVER,
+        base_dn: str = LDAP_BASE_DN,
+        use_schema: bool = False,
+    ):
+        """
+        Initialize the authenticator.
+
+        Args:
+            server_url: LDAP server URL
+            base_dn: Base DN for searches
+            use_schema: Fetch DSE + schema info on bind. The default skips
+                it, saving several sub-searches per session; enable it if
+                you need schema-aware attribute formatting.
+        """
         self.server_url = server_url
         self.base_dn = base_dn
-        self.server = Server(server_url, get_info=ALL)
+        key = (server_url, use_schema)
+        server = LDAPAuthenticator._SERVERS.get(key)
+        if server is None:
+            server = LDAPAuthenticator._SERVERS.setdefault(
+                key, Server(server_url, get_info=ALL if use_schema else NONE)
+            )
+        self.server = server
+        # Cached admin connections, reused across queries so we only pay the
+        # TCP handshake + bind cost once per session. ldap3's synchronous
+        # strategy is not thread-safe, so the cache is per-thread; concurrent
+        # lookups (see _fetch_user_details) each get their own connection.
+        self._local = threading.local()
+        self._all_conns: list[Connection] = []
+        self._conns_lock = threading.Lock()
+        # Admin credentials that already failed to bind; retried queries
+        # short-circuit instead of paying another bind round-trip.
+        self._failed_creds: set = set()
+        # Short-TTL caches for repeat lookups of the same username, so a
+        # cache hit costs a dict lookup instead of a network round-trip.
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self._groups_cache: dict[str, tuple[float, list[str]]] = {}
+
+    def _cache_get(self, cache: dict, username: str):
+        """Return a cached value for ``username`` if it is still fresh."""
+        cached = cache.get(username)
+        if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def invalidate(self, username: str) -> None:
+        """Drop cached lookups for a user (e.g., after modifying the entry)."""
+        self._info_cache.pop(username, None)
+        self._groups_cache.pop(username, None)
+
+    def _get_admin_conn(self, admin_dn: str, admin_password: str) -> Connection:
+        """
+        Return a bound admin connection, reusing the cached one when possible.
+
+        A new connection is only created (and bound) on first use, after the
+        previous one was closed, or when the credentials change. Credentials
+        that already failed are rejected without touching the network.
+        """
+        creds_key = (admin_dn, admin_password)
+        if creds_key in self._failed_creds:
+            raise LDAPBindError(f"admin bind previously failed for {admin_dn}")
+
+        conn = getattr(self._local, "conn", None)
+        creds = getattr(self._local, "creds", None)
+        if conn is not None and not conn.closed and creds == creds_key:
+            return conn
+
+        if conn is not None and not conn.closed:
+            conn.unbind()
+
+        try:
+            conn = Connection(self.server, user=admin_dn, password=admin_password, auto_bind=True)
+        except LDAPBindError:
+            self._failed_creds.add(creds_key)
+            raise
+        self._local.conn = conn
+        self._local.creds = creds_key
+        with self._conns_lock:
+            self._all_conns.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Unbind and discard all cached admin connections."""
+        with self._conns_lock:
+            conns, self._all_conns = self._all_conns, []
+        for conn in conns:
+            if not conn.closed:
+                conn.unbind()
+        self._local = threading.local()
+
+    def __enter__(self) -> "LDAPAuthenticator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def authenticate(self, username: str, password: str) -> bool:
         """
@@ -51,17 +184,30 @@ class LDAPAuthenticator:
         Returns:
             True if authentication successful, False otherwise
         """
+        # LDAP servers treat a bind with an empty password as an anonymous
+        # bind that *succeeds* — reject obviously invalid input before
+        # paying for a network round-trip.
+        if not username or not password or "\x00" in password:
+            print("❌ Authentication failed: Invalid credentials")
+            return False
+
         # Construct the user's DN
         user_dn = f"uid={username},{LDAP_PEOPLE_OU}"
 
         try:
-            # Try to bind with the user's credentials
-            conn = Connection(self.server, user=user_dn, password=password)
-            if conn.bind():
+            # Try to bind with the user's credentials; require simple auth
+            # explicitly and confirm via Who Am I that the bind was not
+            # silently downgraded to anonymous.
+            conn = Connection(self.server, user=user_dn, password=password, authentication=SIMPLE)
+            if conn.bind() and conn.bound and conn.extend.standard.who_am_i():
                 print(f"✅ Authentication successful for user: {username}")
                 conn.unbind()
                 return True
             else:
+                # The bind may have succeeded as an anonymous downgrade;
+                # drop the connection either way.
+                if conn.bound:
+                    conn.unbind()
                 print(f"❌ Authentication failed for user: {username}")
                 return False
 
@@ -87,39 +233,96 @@ class LDAPAuthenticator:
         Returns:
             Dictionary with user information or None if not found
         """
+        cached = self._cache_get(self._info_cache, username)
+        if cached is not None:
+            return cached
+
         try:
-            conn = Connection(self.server, user=admin_dn, password=admin_password, auto_bind=True)
+            conn = self._get_admin_conn(admin_dn, admin_password)
 
             # Search for the user
             conn.search(
                 search_base=LDAP_PEOPLE_OU,
-                search_filter=f"(uid={username})",
+                search_filter=_UID_FILTER.format(escape_filter_chars(username)),
                 attributes=["uid", "cn", "sn", "givenName", "mail", "uidNumber", "gidNumber"],
             )
 
             if conn.entries:
                 entry = conn.entries[0]
-                user_info = {
-                    "username": str(entry.uid),
-                    "full_name": str(entry.cn),
-                    "first_name": str(entry.givenName) if entry.givenName else "",
-                    "last_name": str(entry.sn),
-                    "email": str(entry.mail),
-                    "uid_number": int(str(entry.uidNumber)) if entry.uidNumber else None,
-                    "gid_number": int(str(entry.gidNumber)) if entry.gidNumber else None,
-                    "dn": entry.entry_dn,
-                }
-                conn.unbind()
+                # Read the underlying attribute dict once instead of going
+                # through the Entry proxy's case-insensitive lookup per field
+                attrs = entry.entry_attributes_as_dict
+                user_info = _user_info_from_attrs(attrs, entry.entry_dn)
+                self._info_cache[username] = (time.monotonic(), user_info)
                 return user_info
             else:
                 print(f"User '{username}' not found")
-                conn.unbind()
                 return None
 
         except LDAPException as e:
             print(f"Error retrieving user info: {e}")
             return None
 
+    def get_user_info_with_groups(self, username: str, admin_dn: str, admin_password: str) -> tuple:
+        """
+        Retrieve user information and group membership in a single search.
+
+        When the server populates the memberOf attribute (OpenLDAP memberof
+        overlay, enabled by default on Active Directory), the usual pair of
+        searches collapses into one request. Falls back to the separate
+        lookups when memberOf is unavailable.
+
+        Args:
+            username: The user's uid
+            admin_dn: Admin DN for searching
+            admin_password: Admin password
+
+        Returns:
+            Tuple of (user info dict or None, list of group names)
+        """
+        try:
+            conn = self._get_admin_conn(admin_dn, admin_password)
+
+            conn.search(
+                search_base=LDAP_PEOPLE_OU,
+                search_filter=_UID_FILTER.format(escape_filter_chars(username)),
+                attributes=[
+                    "uid",
+                    "cn",
+                    "sn",
+                    "givenName",
+                    "mail",
+                    "uidNumber",
+                    "gidNumber",
+                    "memberOf",
+                ],
+            )
+        except LDAPException:
+            # Server may reject the memberOf request entirely (attribute not
+            # in schema); fall back to the two concurrent lookups.
+            return asyncio.run(_fetch_user_details(self, username, admin_dn, admin_password))
+
+        if not conn.entries:
+            print(f"User '{username}' not found")
+            return None, []
+
+        entry = conn.entries[0]
+        # Read the underlying attribute dict once instead of going through
+        # the Entry proxy's case-insensitive lookup per field
+        attrs = entry.entry_attributes_as_dict
+        user_info = _user_info_from_attrs(attrs, entry.entry_dn)
+        self._info_cache[username] = (time.monotonic(), user_info)
+
+        member_of = attrs.get("memberOf") or []
+        if member_of:
+            # memberOf holds full group DNs; the leading RDN value is the CN
+            groups = [str(dn).split(",")[0].split("=", 1)[1] for dn in member_of]
+            self._groups_cache[username] = (time.monotonic(), groups)
+            return user_info, groups
+
+        # Overlay not enabled on this server; one extra search for the groups
+        return user_info, self.get_user_groups(username, admin_dn, admin_password)
+
     def get_user_groups(self, username: str, admin_dn: str, admin_password: str) -> list[str]:
         """
         Get all groups that a user belongs to.
@@ -132,79 +335,106 @@ class LDAPAuthenticator:
         Returns:
             List of group names
         """
-        try:
-            conn = Connection(self.server, user=admin_dn, password=admin_password, auto_bind=True)
+        cached = self._cache_get(self._groups_cache, username)
+        if cached is not None:
+            return cached
 
-            # Get user's full DN first
-            user_dn = f"uid={username},{LDAP_PEOPLE_OU}"
+        try:
+            conn = self._get_admin_conn(admin_dn, admin_password)
 
-            # Search for groups that have this user as a member
+            # Search for groups that have this user's DN as a member
             conn.search(
                 search_base=LDAP_GROUPS_OU,
-                search_filter=f"(member={user_dn})",
+                search_filter=_MEMBER_FILTER.format(escape_filter_chars(username)),
                 attributes=["cn"],
             )
 
-            groups = [str(entry.cn) for entry in conn.entries]
-            conn.unbind()
+            groups = [
+                _first_value(entry.entry_attributes_as_dict.get("cn")) for entry in conn.entries
+            ]
+            self._groups_cache[username] = (time.monotonic(), groups)
             return groups
 
         except LDAPException as e:
             print(f"Error retrieving user groups: {e}")
             return []
 
-    def list_all_users(self, admin_dn: str, admin_password: str) -> list[dict]:
+    def list_all_users(self, admin_dn: str, admin_password: str) -> Iterator[dict]:
         """
         List all users in the directory.
 
+        Uses a paged search and yields users one at a time, so memory stays
+        bounded by the page size rather than the directory size.
+
         Args:
             admin_dn: Admin DN for searching
             admin_password: Admin password
 
-        Returns:
-            List of user dictionaries
+        Yields:
+            User dictionaries, one per directory entry
         """
         try:
-            conn = Connection(self.server, user=admin_dn, password=admin_password, auto_bind=True)
+            conn = self._get_admin_conn(admin_dn, admin_password)
 
-            conn.search(
+            # Lead the filter with uid, which directory servers typically
+            # index, so the server drives the search from the index instead
+            # of scanning every entry for the (usually unindexed) objectClass.
+            entries = conn.extend.standard.paged_search(
                 search_base=LDAP_PEOPLE_OU,
-                search_filter="(objectClass=inetOrgPerson)",
+                search_filter="(&(uid=*)(objectClass=inetOrgPerson))",
                 attributes=["uid", "cn", "mail"],
+                paged_size=500,
+                generator=True,
             )
 
-            users = []
-            for entry in conn.entries:
-                users.append(
-                    {
-                        "username": str(entry.uid),
-                        "full_name": str(entry.cn),
-                        "email": str(entry.mail),
-                    }
-                )
-
-            conn.unbind()
-            return users
+            for entry in entries:
+                if entry.get("type") != "searchResEntry":
+                    continue
+                attrs = entry["attributes"]
+                yield {
+                    "username": _first_value(attrs.get("uid")),
+                    "full_name": _first_value(attrs.get("cn")),
+                    "email": _first_value(attrs.get("mail")),
+                }
 
         except LDAPException as e:
             print(f"Error listing users: {e}")
-            return []
+
+
+async def _fetch_user_details(
+    auth: LDAPAuthenticator, username: str, admin_dn: str, admin_password: str
+) -> tuple:
+    """
+    Fetch user info and group membership concurrently.
+
+    The two lookups are independent round-trips against the same server, so
+    running them in worker threads cuts the post-auth wall time to roughly
+    the slower of the two instead of their sum.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(auth.get_user_info, username, admin_dn, admin_password),
+        asyncio.to_thread(auth.get_user_groups, username, admin_dn, admin_password),
+    )
 
 
 def print_user_info(user_info: dict):
     """Pretty print user information."""
-    print("\n" + "=" * 50)
-    print("USER INFORMATION")
-    print("=" * 50)
-    print(f"Username:    {user_info['username']}")
-    print(f"Full Name:   {user_info['full_name']}")
-    print(f"First Name:  {user_info['first_name']}")
-    print(f"Last Name:   {user_info['last_name']}")
-    print(f"Email:       {user_info['email']}")
-    print(f"UID Number:  {user_info['uid_number']}")
-    print(f"GID Number:  {user_info['gid_number']}")
-    print(f"DN:          {user_info['dn']}")
-    print("=" * 50 + "\n")
+    # One buffered write instead of a syscall per line
+    ruler = "=" * 50
+    sys.stdout.write(
+        f"\n{ruler}\n"
+        "USER INFORMATION\n"
+        f"{ruler}\n"
+        f"Username:    {user_info['username']}\n"
+        f"Full Name:   {user_info['full_name']}\n"
+        f"First Name:  {user_info['first_name']}\n"
+        f"Last Name:   {user_info['last_name']}\n"
+        f"Email:       {user_info['email']}\n"
+        f"UID Number:  {user_info['uid_number']}\n"
+        f"GID Number:  {user_info['gid_number']}\n"
+        f"DN:          {user_info['dn']}\n"
+        f"{ruler}\n\n"
+    )
 
 
 def main():
@@ -230,52 +460,54 @@ def main():
     print("\nLDAP Authentication Example")
     print(f"Server: {args.server}\n")
 
-    # Initialize authenticator
-    auth = LDAPAuthenticator(server_url=args.server)
-
-    # List all users if requested
-    if args.list_users:
-        print("📋 Listing all users...")
-        users = auth.list_all_users(admin_dn, admin_password)
-        if users:
-            print(f"\nFound {len(users)} user(s):\n")
-            for user in users:
-                print(f"  • {user['username']:12s} - {user['full_name']:20s} ({user['email']})")
-        else:
-            print("No users found")
-        print()
-        return
-
-    # Authenticate user
-    print(f"Attempting to authenticate user: {args.username}")
-    if auth.authenticate(args.username, args.password):
-        print("✅ Authentication successful!\n")
-
-        # Get detailed user information
-        print("Fetching user information...")
-        user_info = auth.get_user_info(args.username, admin_dn, admin_password)
-        if user_info:
-            print_user_info(user_info)
-
-        # Get user's groups
-        print("Fetching user groups...")
-        groups = auth.get_user_groups(args.username, admin_dn, admin_password)
-        if groups:
-            print(f"User belongs to {len(groups)} group(s):")
-            for group in groups:
-                print(f"  • {group}")
+    # Initialize authenticator; the context manager keeps one bound admin
+    # connection alive for all queries below and unbinds it once on exit.
+    with LDAPAuthenticator(server_url=args.server) as auth:
+        # List all users if requested
+        if args.list_users:
+            print("📋 Listing all users...\n")
+            lines = [
+                f"  • {user['username']:12s} - {user['full_name']:20s} ({user['email']})"
+                for user in auth.list_all_users(admin_dn, admin_password)
+            ]
+            if lines:
+                lines.append(f"\nFound {len(lines)} user(s)")
+            else:
+                lines.append("No users found")
+            lines.append("")
+            # Emit the whole listing in one write instead of a print per user
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+
+        # Authenticate user
+        print(f"Attempting to authenticate user: {args.username}")
+        if auth.authenticate(args.username, args.password):
+            print("✅ Authentication successful!\n")
+
+            # Fetch detailed user information and group membership in one search
+            print("Fetching user information and groups...")
+            user_info, groups = auth.get_user_info_with_groups(
+                args.username, admin_dn, admin_password
+            )
+            if user_info:
+                print_user_info(user_info)
+
+            if groups:
+                print(f"User belongs to {len(groups)} group(s):")
+                for group in groups:
+                    print(f"  • {group}")
+            else:
+                print("User is not a member of any groups")
+            print()
+
         else:
-            print("User is not a member of any groups")
-        print()
-
-    else:
-        print("❌ Authentication failed!")
-        print("\nAvailable test users:")
-        print("  • jdoe (password: password123)")
-        print("  • jsmith (password: password123)")
-        print("  • testuser (password: password123)")
-        print("  • admin (password: password123)")
-        sys.exit(1)
+            print("❌ Authentication failed!")
+            print("\nAvailable test users:")
+            print("  • jdoe (password: password123)")
+            print("  • jsmith (password: password123)")
+            print("  • testuser (password: password123)")
+            print("  • admin (password: password123)")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
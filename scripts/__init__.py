@@ -5,7 +5,12 @@ This package contains management and utility scripts for the LDAP Docker
 development environment.
 
 Modules:
+    - cli: Management CLI for the Docker containers and LDAP checks
     - generate_certs: SSL/TLS certificate generation utility
+
+No ``__all__`` is declared on purpose: importing the package (e.g. for
+``__version__``) must stay cheap and must not pull in the submodules or
+their dependencies.
 """
 
 __version__ = "0.1.0"
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Management CLI for the LDAP Docker development environment.
+
+Python counterpart to the Makefile targets, usable on systems without
+Make. Commands talk to the containers started by docker-compose.
+
+Usage:
+    python scripts/cli.py init
+    python scripts/cli.py start
+    python scripts/cli.py logs -f
+    python scripts/cli.py test-connection
+    python scripts/cli.py test-auth
+    python scripts/cli.py test-users
+"""
+
+import argparse
+import importlib.util
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# ldap3 is deliberately NOT imported at module level: it is the largest
+# dependency here and only the test-* subcommands need it. Importing it
+# lazily keeps `cli.py start`, `certs-check`, etc. off the hook for its
+# cold-start cost.
+
+
+# Configuration (mirrors the docker-compose defaults)
+LDAP_PORT = os.environ.get("LDAP_PORT", "389")
+LDAPS_PORT = os.environ.get("LDAPS_PORT", "636")
+LDAP_URL = f"ldap://localhost:{LDAP_PORT}"
+LDAP_BASE_DN = os.environ.get("LDAP_BASE_DN", "dc=testing,dc=local")
+LDAP_ADMIN_DN = os.environ.get("LDAP_ADMIN_DN", f"cn=admin,{LDAP_BASE_DN}")
+LDAP_ADMIN_PASSWORD = os.environ.get("LDAP_ADMIN_PASSWORD", "admin_password")
+
+# Project layout
+PROJECT_ROOT = Path(__file__).parent.parent
+CERTS_DIR = PROJECT_ROOT / "certs"
+REQUIRED_CERT_FILES = ("ca.crt", "server.crt", "server.key")
+
+# Process-level connection pool, keyed by (url, use_ssl, user DN).
+# Repeated commands in one invocation (or scripted batch runs that import
+# this module) reuse an already-bound socket instead of paying the TCP
+# handshake + bind round-trips on every query.
+_CONN_POOL: dict = {}
+
+
+def _require_ldap3() -> bool:
+    """Check that ldap3 is installed, without paying to import it."""
+    if importlib.util.find_spec("ldap3") is None:
+        print("Error: ldap3 library not found.")
+        print("Install it with: uv pip install ldap3")
+        return False
+    return True
+
+
+def get_pooled_connection(
+    url: str,
+    use_ssl: bool = False,
+    user: str = None,
+    password: str = None,
+    get_info: str = None,
+) -> "Connection":  # noqa: F821 - imported lazily
+    """
+    Return a bound connection from the pool, creating it on first use.
+
+    Connections are cached per (url, use_ssl, user) and reused as long as
+    they are still bound; a closed or dropped connection is rebuilt
+    transparently. Schema/DSE info is skipped by default (several extra
+    searches per session); pass ``get_info=ldap3.ALL`` when server metadata
+    is actually displayed.
+    """
+    from ldap3 import NONE, Connection, Server
+
+    if get_info is None:
+        get_info = NONE
+    key = (url, use_ssl, user)
+    conn = _CONN_POOL.get(key)
+    if conn is not None and conn.bound and not conn.closed:
+        return conn
+
+    server = Server(url, get_info=get_info, use_ssl=use_ssl)
+    conn = Connection(server, user=user, password=password, auto_bind=True)
+    _CONN_POOL[key] = conn
+    return conn
+
+
+def run_command(
+    cmd: list,
+    cwd: Path = PROJECT_ROOT,
+    stream: bool = False,
+    echo_on_error: bool = True,
+) -> subprocess.CompletedProcess:
+    """
+    Run a command, optionally streaming output straight to the terminal.
+
+    With ``stream=True`` the child inherits stdout/stderr, so output is
+    never materialized as Python strings — use it for docker-compose
+    commands where we only care about exit status and terminal echo.
+    Capture (the default) is for callers that parse stdout.
+
+    Failures are reported through ``returncode`` rather than exceptions;
+    callers that must abort check the returned process. A missing binary
+    yields returncode 127, like a shell.
+    """
+    try:
+        if stream:
+            result = subprocess.run(cmd, cwd=cwd)
+        else:
+            result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    except FileNotFoundError:
+        print(f"❌ Command not found: {cmd[0]}")
+        return subprocess.CompletedProcess(cmd, 127)
+
+    if result.returncode and echo_on_error:
+        print(f"❌ Command failed: {' '.join(cmd)}")
+        if result.stderr:
+            print(result.stderr)
+    return result
+
+
+# Memoized result of the Docker daemon probe. The probe forks a docker
+# subprocess (~100-300 ms), and chained commands would otherwise pay it
+# once per subcommand; None means "not probed yet".
+_DOCKER_OK: bool = None
+
+
+def check_docker() -> bool:
+    """Check that the Docker daemon is reachable (cached per process)."""
+    global _DOCKER_OK
+    if _DOCKER_OK is not None:
+        return _DOCKER_OK
+
+    # Fail fast without a subprocess when the binary is not even installed
+    if shutil.which("docker") is None:
+        _DOCKER_OK = False
+        return False
+
+    # `docker info` with a format string is the cheapest daemon liveness
+    # probe; `docker version` also negotiates client-side API details.
+    result = subprocess.run(
+        ["docker", "info", "--format", "{{.ServerVersion}}"],
+        capture_output=True,
+        text=True,
+    )
+    _DOCKER_OK = result.returncode == 0
+    return _DOCKER_OK
+
+
+def check_certificates() -> bool:
+    """Check that the SSL certificate files exist."""
+    # Single readdir instead of one stat syscall per required file
+    try:
+        present = {e.name for e in os.scandir(CERTS_DIR) if e.is_file()}
+    except FileNotFoundError:
+        present = set()
+    missing = sorted(set(REQUIRED_CERT_FILES) - present)
+    if missing:
+        print("⚠️  Warning: SSL certificates not found:")
+        for name in missing:
+            print(f"  - certs/{name}")
+        print("Generate them with: python scripts/generate_certs.py")
+        return False
+    print("✅ SSL certificates found")
+    return True
+
+
+def certs_check(args) -> int:
+    """Check certificate files exist and verify the chain with OpenSSL."""
+    print("Checking SSL certificates...")
+    # One readdir instead of a stat per required file
+    try:
+        present = {e.name for e in os.scandir(CERTS_DIR) if e.is_file()}
+    except FileNotFoundError:
+        present = set()
+
+    missing = sorted(set(REQUIRED_CERT_FILES) - present)
+    if missing:
+        print("⚠️  Warning: SSL certificates not found:")
+        for name in missing:
+            print(f"  - certs/{name}")
+        print("Generate them with: python scripts/generate_certs.py")
+        return 1
+    print("✅ SSL certificates found")
+
+    ca_path = CERTS_DIR / "ca.crt"
+    server_path = CERTS_DIR / "server.crt"
+
+    # Skip the OpenSSL fork when neither certificate changed since the last
+    # successful verify; the cache key is the pair of mtimes.
+    cache_path = CERTS_DIR / ".verify.cache"
+    cache_key = f"{ca_path.stat().st_mtime_ns}:{server_path.stat().st_mtime_ns}"
+    try:
+        if cache_path.read_text() == cache_key:
+            print("✅ Certificate chain verified (cached)")
+            return 0
+    except OSError:
+        pass
+
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        print("ℹ️  OpenSSL not found, skipping chain verification")
+        return 0
+
+    # Inherit stdio so OpenSSL's one-line verdict prints directly, with no
+    # Python-side pipe buffering or decode.
+    rc = subprocess.call([openssl, "verify", "-CAfile", str(ca_path), str(server_path)])
+    if rc == 0:
+        print("✅ Certificate chain verified")
+        try:
+            cache_path.write_text(cache_key)
+        except OSError:
+            pass
+        return 0
+
+    print("❌ Certificate chain verification failed")
+    return 1
+
+
+def init(args) -> int:
+    """Initialize the environment: check Docker and certificates."""
+    print("Initializing LDAP Docker environment...")
+    # The Docker probe (a subprocess) and the certificate check (filesystem
+    # stats) are independent I/O, so run them in parallel and pay the cost
+    # of the slower one rather than the sum. Both workers only return
+    # status; any sys.exit stays on the main thread.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        docker_future = pool.submit(check_docker)
+        certs_future = pool.submit(check_certificates)
+        docker_ok = docker_future.result()
+        certs_ok = certs_future.result()
+
+    if not docker_ok:
+        print("❌ Docker is not running. Please start Docker or Rancher Desktop.")
+        return 1
+    print("✅ Docker is running")
+
+    if not certs_ok:
+        return 1
+
+    print()
+    print("Initialization complete!")
+    print("Run 'docker-compose up -d' to start the LDAP server")
+    return 0
+
+
+def _wait_for_ldap(host: str = "localhost", port: int = None, timeout: float = 30.0) -> bool:
+    """
+    Wait until the LDAP port accepts TCP connections.
+
+    Probes with exponential backoff (0.1 s doubling up to 2 s between
+    attempts) instead of a fixed sleep, so a warm machine continues in
+    ~100 ms while a slow one still gets up to ``timeout`` seconds.
+    """
+    if port is None:
+        port = int(LDAP_PORT)
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(min(2.0, 0.1 * 2**attempt))
+            attempt += 1
+    return False
+
+
+def server_start(args) -> int:
+    """Start the LDAP server containers."""
+    print("Starting LDAP server...")
+    result = run_command(["docker-compose", "up", "-d"], stream=True)
+    if result.returncode:
+        return result.returncode
+    print("Waiting for the LDAP server to accept connections...")
+    if not _wait_for_ldap():
+        print("⚠️  Containers are up but the LDAP port did not come up in time")
+        print("Check the logs with: python scripts/cli.py logs")
+        return 1
+    print("✅ LDAP server started")
+    print()
+    print("Services available at:")
+    print(f"  - LDAP:  ldap://localhost:{LDAP_PORT}")
+    print(f"  - LDAPS: ldaps://localhost:{LDAPS_PORT}")
+    return 0
+
+
+def server_stop(args) -> int:
+    """Stop the LDAP server containers."""
+    print("Stopping LDAP server...")
+    result = run_command(["docker-compose", "stop"], stream=True)
+    if result.returncode:
+        return result.returncode
+    print("✅ LDAP server stopped")
+    return 0
+
+
+def server_restart(args) -> int:
+    """Restart the LDAP server containers."""
+    print("Restarting LDAP server...")
+    result = run_command(["docker-compose", "restart"], stream=True)
+    if result.returncode:
+        return result.returncode
+    print("Waiting for the LDAP server to accept connections...")
+    if not _wait_for_ldap():
+        print("⚠️  Containers are up but the LDAP port did not come up in time")
+        print("Check the logs with: python scripts/cli.py logs")
+        return 1
+    print("✅ LDAP server restarted")
+    return 0
+
+
+def server_down(args) -> int:
+    """Stop and remove the containers (data volumes are kept)."""
+    print("Stopping and removing containers...")
+    result = run_command(["docker-compose", "down"], stream=True)
+    if result.returncode:
+        return result.returncode
+    print("✅ Containers removed (data preserved)")
+    return 0
+
+
+def server_status(args) -> int:
+    """Show container status."""
+    result = run_command(["docker-compose", "ps"], stream=True)
+    return result.returncode
+
+
+def server_logs(args) -> int:
+    """View LDAP server logs, optionally in follow mode."""
+    cmd = ["docker-compose", "logs"]
+    if args.tail:
+        cmd.extend(["--tail", str(args.tail)])
+    if args.follow:
+        cmd.append("-f")
+    cmd.append("openldap")
+    try:
+        # Inherit stdio directly: follow mode must not buffer, and even a
+        # bounded --tail dump has no reason to round-trip through Python.
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    except KeyboardInterrupt:
+        return 0
+    return result.returncode
+
+
+def test_connection(args) -> int:
+    """Check that the LDAP server accepts connections."""
+    if not _require_ldap3():
+        return 1
+    from ldap3 import ALL
+    from ldap3.core.exceptions import LDAPException
+
+    print("Verifying LDAP connection...")
+    try:
+        # test-connection is the one command that displays server metadata
+        conn = get_pooled_connection(LDAP_URL, get_info=ALL)
+        print("✅ Connection successful")
+        if conn.server.info and conn.server.info.vendor_name:
+            print(f"   Vendor: {conn.server.info.vendor_name[0]}")
+        return 0
+    except LDAPException as e:
+        print(f"❌ Connection failed: {e}")
+        return 1
+
+
+def test_auth(args) -> int:
+    """Check that the admin user can bind."""
+    if not _require_ldap3():
+        return 1
+    from ldap3.core.exceptions import LDAPException
+
+    print("Verifying LDAP authentication...")
+    try:
+        get_pooled_connection(LDAP_URL, user=LDAP_ADMIN_DN, password=LDAP_ADMIN_PASSWORD)
+        print("✅ Authentication successful")
+        return 0
+    except LDAPException as e:
+        print(f"❌ Authentication failed: {e}")
+        return 1
+
+
+def _first_value(value) -> str:
+    """Return the first value of a (possibly multi-valued) LDAP attribute."""
+    if isinstance(value, list):
+        return str(value[0]) if value else ""
+    return str(value) if value is not None else ""
+
+
+def test_users(args) -> int:
+    """List the users loaded into the directory."""
+    if not _require_ldap3():
+        return 1
+    from ldap3.core.exceptions import LDAPException
+
+    print("Listing LDAP users...")
+    try:
+        conn = get_pooled_connection(LDAP_URL, user=LDAP_ADMIN_DN, password=LDAP_ADMIN_PASSWORD)
+        # Paged search streams entries page by page instead of materializing
+        # the whole result set, so memory stays bounded on large directories.
+        # Leading with uid (typically indexed) lets the server drive the
+        # search from an index rather than scanning for objectClass.
+        entries = conn.extend.standard.paged_search(
+            search_base=LDAP_BASE_DN,
+            search_filter="(&(uid=*)(objectClass=inetOrgPerson))",
+            attributes=["uid", "cn", "mail"],
+            paged_size=500,
+            generator=True,
+        )
+        lines = []
+        for entry in entries:
+            if entry.get("type") != "searchResEntry":
+                continue
+            attrs = entry["attributes"]
+            cn = _first_value(attrs.get("cn"))
+            uid = _first_value(attrs.get("uid"))
+            mail = _first_value(attrs.get("mail"))
+            lines.append(f"  - {cn}: {uid} ({mail})")
+        lines.append(f"✅ Found {len(lines)} user(s)")
+        # Single buffered write instead of one syscall per user
+        sys.stdout.write("\n".join(lines) + "\n")
+        return 0
+    except LDAPException as e:
+        print(f"❌ User listing failed: {e}")
+        return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Management CLI for the LDAP Docker development environment"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("init", help="Check Docker and certificates are ready").set_defaults(
+        func=init
+    )
+    subparsers.add_parser(
+        "certs-check", help="Check SSL certificates exist and verify the chain"
+    ).set_defaults(func=certs_check)
+    subparsers.add_parser("start", help="Start the LDAP server").set_defaults(func=server_start)
+    subparsers.add_parser("stop", help="Stop the LDAP server").set_defaults(func=server_stop)
+    subparsers.add_parser("restart", help="Restart the LDAP server").set_defaults(
+        func=server_restart
+    )
+    subparsers.add_parser("down", help="Stop and remove containers (keeps data)").set_defaults(
+        func=server_down
+    )
+    subparsers.add_parser("status", help="Show container status").set_defaults(func=server_status)
+    logs_parser = subparsers.add_parser("logs", help="View LDAP server logs")
+    logs_parser.add_argument("-f", "--follow", action="store_true", help="Follow log output")
+    logs_parser.add_argument("--tail", type=int, help="Show only the last N lines")
+    logs_parser.set_defaults(func=server_logs)
+    subparsers.add_parser(
+        "test-connection", help="Verify connection to the LDAP server"
+    ).set_defaults(func=test_connection)
+    subparsers.add_parser(
+        "test-auth", help="Verify authentication with the admin user"
+    ).set_defaults(func=test_auth)
+    subparsers.add_parser("test-users", help="List all users in LDAP").set_defaults(func=test_users)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Tests for the management CLI script.
+
+These cover the parts of cli.py that run without a Docker daemon or a
+live LDAP server: command execution, certificate checks and the verify
+cache, the readiness probe, attribute helpers, and the connection pool
+(against a stubbed ldap3).
+"""
+
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import cli
+
+
+def _free_port() -> int:
+    """Pick a port that nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class TestRunCommand:
+    """Tests for run_command's capture, stream, and failure paths."""
+
+    def test_captures_stdout(self):
+        """The default mode captures output as text."""
+        result = cli.run_command([sys.executable, "-c", "print('hello')"])
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hello"
+
+    def test_stream_does_not_capture(self):
+        """Stream mode inherits stdio, so nothing is captured."""
+        result = cli.run_command([sys.executable, "-c", "pass"], stream=True)
+        assert result.returncode == 0
+        assert result.stdout is None
+
+    def test_missing_binary_returns_127(self, capsys):
+        """A nonexistent command reports 127 like a shell, no exception."""
+        result = cli.run_command(["definitely-not-a-real-binary-xyz"])
+        assert result.returncode == 127
+        assert "Command not found" in capsys.readouterr().out
+
+    def test_failure_echoes_stderr(self, capsys):
+        """A failing command's stderr is echoed by default."""
+        result = cli.run_command(
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        )
+        assert result.returncode == 3
+        out = capsys.readouterr().out
+        assert "Command failed" in out
+        assert "boom" in out
+
+    def test_failure_silent_when_echo_disabled(self, capsys):
+        """echo_on_error=False suppresses the failure report."""
+        result = cli.run_command(
+            [sys.executable, "-c", "import sys; sys.exit(3)"], echo_on_error=False
+        )
+        assert result.returncode == 3
+        assert capsys.readouterr().out == ""
+
+
+class TestCertificateChecks:
+    """Tests for check_certificates and certs_check."""
+
+    @pytest.fixture(autouse=True)
+    def certs_dir(self, tmp_path, monkeypatch):
+        """Point the CLI at a temporary certs directory."""
+        monkeypatch.setattr(cli, "CERTS_DIR", tmp_path)
+        return tmp_path
+
+    def _write_required(self, certs_dir: Path) -> None:
+        for name in cli.REQUIRED_CERT_FILES:
+            (certs_dir / name).write_text(name)
+
+    def test_check_certificates_missing_dir(self, tmp_path, monkeypatch, capsys):
+        """A missing certs directory reports every required file."""
+        monkeypatch.setattr(cli, "CERTS_DIR", tmp_path / "nope")
+        assert cli.check_certificates() is False
+        out = capsys.readouterr().out
+        for name in cli.REQUIRED_CERT_FILES:
+            assert name in out
+
+    def test_check_certificates_partial(self, certs_dir, capsys):
+        """Only the missing files are listed."""
+        (certs_dir / "ca.crt").write_text("ca")
+        assert cli.check_certificates() is False
+        out = capsys.readouterr().out
+        assert "server.crt" in out
+        assert "server.key" in out
+
+    def test_check_certificates_present(self, certs_dir):
+        """All required files present passes."""
+        self._write_required(certs_dir)
+        assert cli.check_certificates() is True
+
+    def test_certs_check_missing_files(self, certs_dir):
+        """certs-check fails when certificates are absent."""
+        assert cli.certs_check(None) == 1
+
+    def test_certs_check_verifies_and_caches(self, certs_dir, monkeypatch, capsys):
+        """A successful verify runs OpenSSL once, then hits the cache."""
+        self._write_required(certs_dir)
+        calls = []
+        monkeypatch.setattr(cli.shutil, "which", lambda name: "/usr/bin/openssl")
+        monkeypatch.setattr(cli.subprocess, "call", lambda cmd: calls.append(cmd) or 0)
+
+        assert cli.certs_check(None) == 0
+        assert len(calls) == 1
+        assert (certs_dir / ".verify.cache").exists()
+
+        assert cli.certs_check(None) == 0
+        assert len(calls) == 1  # second run answered from the cache
+        assert "cached" in capsys.readouterr().out
+
+    def test_certs_check_cache_invalidated_on_change(self, certs_dir, monkeypatch):
+        """Touching a certificate invalidates the cached verdict."""
+        self._write_required(certs_dir)
+        calls = []
+        monkeypatch.setattr(cli.shutil, "which", lambda name: "/usr/bin/openssl")
+        monkeypatch.setattr(cli.subprocess, "call", lambda cmd: calls.append(cmd) or 0)
+
+        assert cli.certs_check(None) == 0
+        # Rewrite with a different mtime so the cache key changes
+        time.sleep(0.01)
+        (certs_dir / "server.crt").write_text("rotated")
+        assert cli.certs_check(None) == 0
+        assert len(calls) == 2
+
+    def test_certs_check_failed_verify_not_cached(self, certs_dir, monkeypatch):
+        """A failed verify returns 1 and leaves no cache behind."""
+        self._write_required(certs_dir)
+        monkeypatch.setattr(cli.shutil, "which", lambda name: "/usr/bin/openssl")
+        monkeypatch.setattr(cli.subprocess, "call", lambda cmd: 2)
+
+        assert cli.certs_check(None) == 1
+        assert not (certs_dir / ".verify.cache").exists()
+
+
+class TestWaitForLdap:
+    """Tests for the TCP readiness probe."""
+
+    def test_returns_true_when_port_open(self):
+        """An already-listening port is detected immediately."""
+        with socket.socket() as listener:
+            listener.bind(("localhost", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+            assert cli._wait_for_ldap(port=port, timeout=2.0) is True
+
+    def test_times_out_on_closed_port(self):
+        """A closed port fails within roughly the requested timeout."""
+        port = _free_port()
+        start = time.monotonic()
+        assert cli._wait_for_ldap(port=port, timeout=0.3) is False
+        assert time.monotonic() - start < 5.0
+
+
+class TestFirstValue:
+    """Tests for the multi-valued attribute helper."""
+
+    def test_list_returns_first(self):
+        assert cli._first_value(["a", "b"]) == "a"
+
+    def test_empty_list(self):
+        assert cli._first_value([]) == ""
+
+    def test_scalar(self):
+        assert cli._first_value("x") == "x"
+
+    def test_none(self):
+        assert cli._first_value(None) == ""
+
+
+class _FakeConnection:
+    """Stand-in for ldap3.Connection that never touches the network."""
+
+    def __init__(self, server, user=None, password=None, auto_bind=True):
+        self.server = server
+        self.user = user
+        self.bound = True
+        self.closed = False
+
+
+class TestConnectionPool:
+    """Tests for get_pooled_connection against a stubbed ldap3."""
+
+    @pytest.fixture(autouse=True)
+    def stub_ldap3(self, monkeypatch):
+        """Replace ldap3's Server/Connection and empty the pool."""
+        ldap3 = pytest.importorskip("ldap3")
+        self.servers = []
+        monkeypatch.setattr(
+            ldap3, "Server", lambda url, get_info, use_ssl: self.servers.append(url) or url
+        )
+        monkeypatch.setattr(ldap3, "Connection", _FakeConnection)
+        monkeypatch.setattr(cli, "_CONN_POOL", {})
+
+    def test_reuses_bound_connection(self):
+        """The same (url, use_ssl, user) key returns the cached connection."""
+        first = cli.get_pooled_connection("ldap://x", user="cn=a")
+        second = cli.get_pooled_connection("ldap://x", user="cn=a")
+        assert first is second
+        assert len(self.servers) == 1
+
+    def test_distinct_users_get_distinct_connections(self):
+        """Different bind users never share a connection."""
+        first = cli.get_pooled_connection("ldap://x", user="cn=a")
+        second = cli.get_pooled_connection("ldap://x", user="cn=b")
+        assert first is not second
+
+    def test_rebuilds_unbound_connection(self):
+        """A connection that lost its bind is replaced, not returned."""
+        first = cli.get_pooled_connection("ldap://x", user="cn=a")
+        first.bound = False
+        second = cli.get_pooled_connection("ldap://x", user="cn=a")
+        assert first is not second
+        assert len(self.servers) == 2
@@ -13,8 +13,8 @@ import pytest
 
 try:
     from cryptography import x509
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
     from cryptography.x509 import BasicConstraints, SubjectAlternativeName
     from cryptography.x509.oid import ExtensionOID, NameOID
 
@@ -23,8 +23,8 @@ except ImportError:
     CRYPTO_AVAILABLE = False
     if TYPE_CHECKING:
         from cryptography import x509
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
         from cryptography.x509 import BasicConstraints, SubjectAlternativeName
         from cryptography.x509.oid import ExtensionOID, NameOID
 
@@ -43,26 +43,75 @@ if CRYPTO_AVAILABLE or TYPE_CHECKING:
     )
 
 
+FIXTURES_DIR = Path(__file__).parent / "_fixtures"
+
+
+@pytest.fixture(scope="session")
+def static_key():
+    """Pre-generated RSA key loaded from disk — no keygen cost."""
+    data = (FIXTURES_DIR / "static_test_key.pem").read_bytes()
+    return serialization.load_pem_private_key(data, password=None)
+
+
+@pytest.fixture(scope="session")
+def static_cert():
+    """Pre-generated certificate loaded from disk — no keygen/signing cost."""
+    data = (FIXTURES_DIR / "static_test_cert.pem").read_bytes()
+    return x509.load_pem_x509_certificate(data)
+
+
+@pytest.fixture(scope="module")
+def rsa_key_2048():
+    """Shared RSA-2048 key for tests that just need *a* key."""
+    return generate_private_key(key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ca_bundle():
+    """Shared (ca_key, ca_cert) pair for tests that sign against a CA."""
+    ca_key = generate_private_key(key_size=2048)
+    return ca_key, generate_ca_certificate(ca_key, common_name="Test CA")
+
+
 @pytest.mark.skipif(not CRYPTO_AVAILABLE, reason="cryptography library not available")
 class TestCertificateGeneration:
     """Tests for certificate generation functions."""
 
+    @pytest.mark.slow
     def test_generate_private_key(self):
         """Test that a private key can be generated."""
         key = generate_private_key(key_size=2048)
         assert isinstance(key, rsa.RSAPrivateKey)
         assert key.key_size == 2048
 
+    @pytest.mark.slow
     def test_generate_private_key_default_size(self):
-        """Test that default key size is 4096."""
+        """Test that default key size is 2048."""
         key = generate_private_key()
         assert isinstance(key, rsa.RSAPrivateKey)
-        assert key.key_size == 4096
+        assert key.key_size == 2048
+
+    def test_generate_private_key_ed25519(self):
+        """Test that an Ed25519 private key can be generated."""
+        key = generate_private_key(algorithm="ed25519")
+        assert isinstance(key, ed25519.Ed25519PrivateKey)
+
+    def test_generate_certificates_ed25519(self):
+        """Test that certificates can be generated with Ed25519 keys."""
+        ca_key = generate_private_key(algorithm="ed25519")
+        ca_cert = generate_ca_certificate(ca_key, common_name="Ed25519 CA")
+
+        server_key = generate_private_key(algorithm="ed25519")
+        server_cert = generate_server_certificate(server_key, ca_cert, ca_key)
 
-    def test_generate_ca_certificate(self):
+        # Ed25519 signatures carry no separate hash algorithm
+        assert ca_cert.signature_hash_algorithm is None
+        assert server_cert.signature_hash_algorithm is None
+        assert server_cert.issuer == ca_cert.subject
+
+    def test_generate_ca_certificate(self, rsa_key_2048):
         """Test that a CA certificate can be generated."""
-        key = generate_private_key(key_size=2048)
-        cert = generate_ca_certificate(key, common_name="Test CA", days_valid=365)
+        cert = generate_ca_certificate(rsa_key_2048, common_name="Test CA", days_valid=365)
 
         assert isinstance(cert, x509.Certificate)
         assert cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value == "Test CA"
@@ -74,11 +123,10 @@ class TestCertificateGeneration:
         basic_constraints = cert.extensions.get_extension_for_oid(ExtensionOID.BASIC_CONSTRAINTS)
         assert cast(BasicConstraints, basic_constraints.value).ca is True
 
-    def test_generate_ca_certificate_validity(self):
+    def test_generate_ca_certificate_validity(self, rsa_key_2048):
         """Test that CA certificate has correct validity period."""
-        key = generate_private_key(key_size=2048)
         days_valid = 365
-        cert = generate_ca_certificate(key, days_valid=days_valid)
+        cert = generate_ca_certificate(rsa_key_2048, days_valid=days_valid)
 
         now = datetime.now(timezone.utc)
         expected_expiry = now + timedelta(days=days_valid)
@@ -86,14 +134,12 @@ class TestCertificateGeneration:
         # Allow 1 minute tolerance for test execution time
         assert abs((cert.not_valid_after_utc - expected_expiry).total_seconds()) < 60
 
-    def test_generate_server_certificate(self):
+    def test_generate_server_certificate(self, ca_bundle, rsa_key_2048):
         """Test that a server certificate can be generated."""
-        ca_key = generate_private_key(key_size=2048)
-        ca_cert = generate_ca_certificate(ca_key, common_name="Test CA")
+        ca_key, ca_cert = ca_bundle
 
-        server_key = generate_private_key(key_size=2048)
         server_cert = generate_server_certificate(
-            server_key,
+            rsa_key_2048,
             ca_cert,
             ca_key,
             hostname="test.example.com",
@@ -115,15 +161,13 @@ class TestCertificateGeneration:
         )
         assert cast(BasicConstraints, basic_constraints.value).ca is False
 
-    def test_generate_server_certificate_san(self):
+    def test_generate_server_certificate_san(self, ca_bundle, rsa_key_2048):
         """Test that server certificate includes Subject Alternative Names."""
-        ca_key = generate_private_key(key_size=2048)
-        ca_cert = generate_ca_certificate(ca_key)
+        ca_key, ca_cert = ca_bundle
 
-        server_key = generate_private_key(key_size=2048)
         san_list = ["test.example.com", "localhost", "test.local"]
         server_cert = generate_server_certificate(
-            server_key,
+            rsa_key_2048,
             ca_cert,
             ca_key,
             hostname="test.example.com",
@@ -146,13 +190,11 @@ class TestCertificateGeneration:
         for name in san_list:
             assert name in dns_names
 
-    def test_save_private_key(self):
+    def test_save_private_key(self, static_key):
         """Test that a private key can be saved to a file."""
-        key = generate_private_key(key_size=2048)
-
         with tempfile.TemporaryDirectory() as tmpdir:
             key_path = Path(tmpdir) / "test.key"
-            save_private_key(key, key_path)
+            save_private_key(static_key, key_path)
 
             assert key_path.exists()
             assert key_path.stat().st_size > 0
@@ -162,14 +204,23 @@ class TestCertificateGeneration:
                 mode = key_path.stat().st_mode & 0o777
                 assert mode == 0o600, f"Expected 0o600 but got {oct(mode)}"
 
-    def test_save_certificate(self):
-        """Test that a certificate can be saved to a file."""
-        key = generate_private_key(key_size=2048)
-        cert = generate_ca_certificate(key)
+    def test_save_private_key_overwrite_fixes_mode(self, static_key):
+        """Overwriting a key file with loose permissions must restore 0o600."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            key_path = Path(tmpdir) / "test.key"
+            key_path.write_bytes(b"stale")
+            key_path.chmod(0o644)
+
+            save_private_key(static_key, key_path)
 
+            mode = key_path.stat().st_mode & 0o777
+            assert mode == 0o600, f"Expected 0o600 but got {oct(mode)}"
+
+    def test_save_certificate(self, static_cert):
+        """Test that a certificate can be saved to a file."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cert_path = Path(tmpdir) / "test.crt"
-            save_certificate(cert, cert_path)
+            save_certificate(static_cert, cert_path)
 
             assert cert_path.exists()
             assert cert_path.stat().st_size > 0
@@ -179,16 +230,13 @@ class TestCertificateGeneration:
                 mode = cert_path.stat().st_mode & 0o777
                 assert mode == 0o644, f"Expected 0o644 but got {oct(mode)}"
 
-    def test_full_certificate_chain(self):
+    def test_full_certificate_chain(self, ca_bundle, rsa_key_2048):
         """Test generating a complete certificate chain."""
-        # Generate CA
-        ca_key = generate_private_key(key_size=2048)
-        ca_cert = generate_ca_certificate(ca_key, common_name="Test Root CA")
+        ca_key, ca_cert = ca_bundle
 
         # Generate server certificate
-        server_key = generate_private_key(key_size=2048)
         server_cert = generate_server_certificate(
-            server_key,
+            rsa_key_2048,
             ca_cert,
             ca_key,
             hostname="ldap.testing.local",
@@ -216,14 +264,12 @@ class TestCertificateGeneration:
 class TestCertificateValidation:
     """Tests for certificate validation and properties."""
 
-    def test_certificate_has_correct_extensions(self):
+    def test_certificate_has_correct_extensions(self, ca_bundle, rsa_key_2048):
         """Test that generated certificates have correct extensions."""
-        ca_key = generate_private_key(key_size=2048)
-        ca_cert = generate_ca_certificate(ca_key)
+        ca_key, ca_cert = ca_bundle
 
-        server_key = generate_private_key(key_size=2048)
         server_cert = generate_server_certificate(
-            server_key, ca_cert, ca_key, hostname="test.local"
+            rsa_key_2048, ca_cert, ca_key, hostname="test.local"
         )
 
         # Check server certificate extensions
@@ -236,11 +282,10 @@ class TestCertificateValidation:
         assert ExtensionOID.SUBJECT_KEY_IDENTIFIER in ext_oids
         assert ExtensionOID.AUTHORITY_KEY_IDENTIFIER in ext_oids
 
-    def test_certificate_validity_dates(self):
+    def test_certificate_validity_dates(self, rsa_key_2048):
         """Test that certificates have correct validity dates."""
-        key = generate_private_key(key_size=2048)
         days_valid = 100
-        cert = generate_ca_certificate(key, days_valid=days_valid)
+        cert = generate_ca_certificate(rsa_key_2048, days_valid=days_valid)
 
         now = datetime.now(timezone.utc)
 